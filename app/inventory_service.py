@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import event
+from sqlmodel import Integer, Numeric, Session, col, column, insert, or_, select, update, values
+
+from app.database import get_session
+from app.models import (
+    Product,
+    ProductSummary,
+    PurchaseItemCreate,
+    SaleItemCreate,
+    StockMovement,
+    TransactionType,
+)
+
+
+def list_product_summaries(search: Optional[str] = None, include_inactive: bool = False) -> List[ProductSummary]:
+    """List products for listing/POS screens from the denormalized summary table, ordered by name."""
+    query = select(ProductSummary)
+    if not include_inactive:
+        query = query.where(ProductSummary.is_active == True)  # noqa: E712
+    if search:
+        pattern = f"%{search}%"
+        query = query.where(or_(col(ProductSummary.code).ilike(pattern), col(ProductSummary.name).ilike(pattern)))
+    query = query.order_by(ProductSummary.name)
+
+    with get_session() as session:
+        return list(session.exec(query).all())
+
+
+# Stock levels are read on every POS screen, so they are cached per product id for a short time.
+# Writes go through the committing session: changed levels are collected while the transaction runs
+# and only reach the cache after commit, so a rolled-back sale never leaks into it.
+STOCK_CACHE_TTL_SECONDS = 30.0
+_PENDING_STOCK_KEY = "pending_stock_levels"
+
+_stock_cache: Dict[int, Tuple[Decimal, float]] = {}
+# Bumped on every published change; a read-through fill only lands if the version it started from still holds
+_stock_versions: Dict[int, int] = {}
+_stock_cache_lock = threading.Lock()
+
+
+def _publish_stock_levels(levels: Mapping[int, Optional[Decimal]]) -> None:
+    """Store committed stock levels; a None level drops the product from the cache."""
+    expires_at = time.monotonic() + STOCK_CACHE_TTL_SECONDS
+    with _stock_cache_lock:
+        for product_id, quantity in levels.items():
+            _stock_versions[product_id] = _stock_versions.get(product_id, 0) + 1
+            if quantity is None:
+                _stock_cache.pop(product_id, None)
+            else:
+                _stock_cache[product_id] = (quantity, expires_at)
+
+
+def _fill_stock_levels(levels: Mapping[int, Decimal], versions: Mapping[int, int]) -> None:
+    """Cache levels read from the database, skipping products changed since `versions` was taken."""
+    expires_at = time.monotonic() + STOCK_CACHE_TTL_SECONDS
+    with _stock_cache_lock:
+        for product_id, quantity in levels.items():
+            if _stock_versions.get(product_id, 0) == versions[product_id]:
+                _stock_cache[product_id] = (quantity, expires_at)
+
+
+def _pending_stock_levels(session: Session) -> Dict[int, Optional[Decimal]]:
+    return session.info.setdefault(_PENDING_STOCK_KEY, {})
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_product_stock_changes(session: Session, flush_context: Any) -> None:
+    """Products written through the ORM may have a new stock level; invalidate them on commit."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Product) and obj.id is not None:
+            _pending_stock_levels(session)[obj.id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_stock_changes(session: Session) -> None:
+    levels = session.info.pop(_PENDING_STOCK_KEY, None)
+    if levels:
+        _publish_stock_levels(levels)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stock_changes(session: Session) -> None:
+    session.info.pop(_PENDING_STOCK_KEY, None)
+
+
+def get_stock(product_ids: Iterable[int]) -> Dict[int, Decimal]:
+    """Current stock quantity per product id; cache misses are filled with a single query.
+
+    Unknown product ids are left out of the result.
+    """
+    wanted = set(product_ids)
+    now = time.monotonic()
+    with _stock_cache_lock:
+        stock = {
+            product_id: quantity
+            for product_id, (quantity, expires_at) in _stock_cache.items()
+            if product_id in wanted and expires_at > now
+        }
+        missing = wanted - stock.keys()
+        versions = {product_id: _stock_versions.get(product_id, 0) for product_id in missing}
+
+    if missing:
+        with get_session() as session:
+            rows = session.exec(
+                select(col(Product.id), col(Product.stock_quantity)).where(col(Product.id).in_(sorted(missing)))
+            ).all()
+        fetched = {product_id: quantity for product_id, quantity in rows if product_id is not None}
+        # A commit landing between the SELECT and here has published a newer level; don't overwrite it
+        _fill_stock_levels(fetched, versions)
+        stock.update(fetched)
+    return stock
+
+
+def apply_stock_movements(
+    session: Session,
+    transaction_type: TransactionType,
+    reference_id: int,
+    reference_number: str,
+    movement_date: datetime,
+    items: Sequence[Union[PurchaseItemCreate, SaleItemCreate]],
+) -> None:
+    """Adjust product stock for invoice lines and record the matching stock movements.
+
+    Runs inside the caller's session so the invoice, its lines and the stock changes commit together.
+    Purchases add stock at the purchase price; sales remove stock at the product's purchase price.
+    """
+    is_purchase = transaction_type == TransactionType.PURCHASE
+
+    # Net change per product; an invoice may list the same product on several lines
+    deltas: Dict[int, Decimal] = defaultdict(Decimal)
+    for item in items:
+        deltas[item.product_id] += item.quantity if is_purchase else -item.quantity
+
+    # Apply all stock changes in one UPDATE ... FROM (VALUES ...) RETURNING round-trip.
+    # The guard keeps stock from going negative; products it rejects are missing from the result.
+    # Rows go in product id order so concurrent invoices lock shared products in the same order.
+    changes = values(column("product_id", Integer), column("delta", Numeric), name="changes").data(
+        sorted(deltas.items())
+    )
+    stock_update = (
+        update(Product)
+        .where(col(Product.id) == changes.c.product_id)
+        .where(col(Product.stock_quantity) + changes.c.delta >= 0)
+        .values(stock_quantity=col(Product.stock_quantity) + changes.c.delta)
+        .returning(col(Product.id), col(Product.stock_quantity), col(Product.purchase_price))
+    )
+    updated = {row.id: row for row in session.execute(stock_update, execution_options={"synchronize_session": False})}
+
+    for product_id in deltas:
+        if product_id not in updated:
+            product = session.get(Product, product_id)
+            if product is None:
+                raise ValueError(f"Product {product_id} not found")
+            raise ValueError(f"Insufficient stock for product {product.code}")
+    _pending_stock_levels(session).update({product_id: row.stock_quantity for product_id, row in updated.items()})
+
+    movements = []
+    for item in items:
+        if is_purchase:
+            quantity_in, quantity_out, unit_cost = item.quantity, Decimal("0"), item.unit_price
+        else:
+            quantity_in, quantity_out = Decimal("0"), item.quantity
+            unit_cost = updated[item.product_id].purchase_price
+
+        movements.append(
+            {
+                "product_id": item.product_id,
+                "transaction_type": transaction_type,
+                "reference_id": reference_id,
+                "reference_number": reference_number,
+                "quantity_in": quantity_in,
+                "quantity_out": quantity_out,
+                "unit_cost": unit_cost,
+                "movement_date": movement_date,
+            }
+        )
+
+    session.execute(insert(StockMovement), movements)
@@ -0,0 +1,105 @@
+from decimal import Decimal
+from typing import Any, TypeVar, Union
+
+from sqlmodel import col, insert, update
+
+from app.database import get_async_session
+from app.inventory_service import apply_stock_movements
+from app.models import (
+    Customer,
+    Purchase,
+    PurchaseCreate,
+    PurchaseItem,
+    Sale,
+    SaleCreate,
+    SaleItem,
+    Supplier,
+    TransactionType,
+    round_money,
+)
+
+InvoiceT = TypeVar("InvoiceT", Purchase, Sale)
+
+
+async def create_invoice(
+    data: Union[PurchaseCreate, SaleCreate],
+    header_model: type[InvoiceT],
+    item_model: type[Union[PurchaseItem, SaleItem]],
+    party_model: type[Union[Customer, Supplier]],
+    transaction_type: TransactionType,
+) -> InvoiceT:
+    """Write an invoice with its line items, stock movements and party balance in one transaction.
+
+    Shared by sales and purchases; the foreign key names follow the model names
+    (``customer_id``/``supplier_id`` on the header, ``sale_id``/``purchase_id`` on the lines).
+    """
+    invoice_label = header_model.__name__
+    party_label = party_model.__name__
+    party_field = f"{party_label.lower()}_id"
+    party_id: int = getattr(data, party_field)
+    party_key: dict[str, Any] = {party_field: party_id}
+
+    if not data.items:
+        raise ValueError(f"{invoice_label} must contain at least one item")
+
+    # Round each line to cents before summing so the subtotal equals the sum of the stored line totals
+    line_totals = [round_money(item.quantity * item.unit_price - item.discount_amount) for item in data.items]
+    subtotal = sum(line_totals, Decimal("0"))
+
+    async with get_async_session() as session:
+        party = await session.get(party_model, party_id)
+        if party is None:
+            raise ValueError(f"{party_label} {party_id} not found")
+
+        invoice = header_model(
+            invoice_number=data.invoice_number,
+            transaction_date=data.transaction_date,
+            due_date=data.due_date,
+            subtotal=subtotal,
+            tax_amount=data.tax_amount,
+            discount_amount=data.discount_amount,
+            total_amount=subtotal + data.tax_amount - data.discount_amount,
+            notes=data.notes,
+            **party_key,
+        )
+        session.add(invoice)
+        await session.flush()
+        if invoice.id is None:
+            raise ValueError(f"{invoice_label} ID cannot be None")
+
+        # The stock update runs on the session's sync facade; its statements still go out over asyncpg
+        await session.run_sync(
+            apply_stock_movements,  # type: ignore[arg-type]
+            transaction_type,
+            invoice.id,
+            invoice.invoice_number,
+            invoice.transaction_date,
+            data.items,
+        )
+
+        # One multi-row INSERT for all lines instead of a flush per item object
+        await session.execute(
+            insert(item_model),
+            [
+                {
+                    f"{invoice_label.lower()}_id": invoice.id,
+                    "product_id": item.product_id,
+                    "quantity": item.quantity,
+                    "unit_price": item.unit_price,
+                    "discount_amount": item.discount_amount,
+                    "total_amount": line_total,
+                }
+                for item, line_total in zip(data.items, line_totals)
+            ],
+        )
+        # Increment in SQL under the row lock so concurrent invoices for one party cannot lose an update
+        await session.execute(
+            update(party_model)
+            .where(col(party_model.id) == party_id)
+            .values(current_balance=col(party_model.current_balance) + invoice.total_amount),
+            execution_options={"synchronize_session": False},
+        )
+
+        await session.commit()
+        await session.refresh(invoice)
+        return invoice
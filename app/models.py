@@ -1,7 +1,13 @@
-from sqlmodel import SQLModel, Field, Relationship
-from datetime import datetime
-from decimal import Decimal
-from typing import Optional, List
+import operator
+
+from sqlalchemy import DDL, BigInteger, Dialect, Enum as SAEnum, TypeDecorator, event
+from sqlalchemy.sql import operators
+from sqlalchemy.types import TypeEngine
+from sqlmodel import SQLModel, Field, Relationship, Column, Computed, DateTime, Index, Numeric, Text, desc, func, text
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from pydantic import ConfigDict
+from typing import Any, Optional, List
 from enum import Enum
 
 
@@ -25,93 +31,320 @@ class PaymentType(str, Enum):
     CHECK = "check"
 
 
+# Native PostgreSQL enum types shared by every column of that kind. Rows store the lower-case
+# member values, so SQL literals and server defaults match the Python enum values.
+def _enum_values(enum_class: type[Enum]) -> List[str]:
+    return [member.value for member in enum_class]
+
+
+TRANSACTION_TYPE_ENUM = SAEnum(TransactionType, name="transaction_type_enum", values_callable=_enum_values)
+PAYMENT_STATUS_ENUM = SAEnum(PaymentStatus, name="payment_status_enum", values_callable=_enum_values)
+PAYMENT_TYPE_ENUM = SAEnum(PaymentType, name="payment_type_enum", values_callable=_enum_values)
+
+
+def round_money(amount: Decimal) -> Decimal:
+    """Round an amount half-up to whole cents, the precision money columns store."""
+    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+class Cents(TypeDecorator):
+    """Money stored as BIGINT cents in the database and exposed to Python as a two-place Decimal.
+
+    Integer storage is fixed-width and makes sums, comparisons and sorts cheaper than NUMERIC; the
+    conversion happens only at the database boundary, so models and schemas keep working with Decimal.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def coerce_compared_value(self, op: Optional[operators.OperatorType], value: Any) -> TypeEngine[Any]:
+        # Only sums, differences and comparisons are between two amounts; factors and divisors are plain
+        # numbers and must not be scaled to cents (price * 1.10 would otherwise multiply by 110)
+        if op in (operator.add, operator.sub) or (op is not None and operators.is_comparison(op)):
+            return self
+        return Numeric()
+
+    def process_bind_param(self, value: Optional[Decimal], dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return int(round_money(Decimal(str(value))).scaleb(2))
+
+    def process_result_value(self, value: Optional[int], dialect: Dialect) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+class UTCDateTime(TypeDecorator):
+    """TIMESTAMPTZ that reads naive datetimes as UTC and returns UTC-aware ones.
+
+    Without it asyncpg interprets a naive value in the process's local timezone and psycopg2 in the
+    server's TimeZone setting, so the same input could land on different instants depending on the engine.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect: Dialect) -> Optional[datetime]:
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=timezone.utc)
+
+    def process_result_value(self, value: Optional[datetime], dialect: Dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return value.astimezone(timezone.utc)
+
+
+def _money_column(*, zero_default: bool = False) -> Column:
+    """Non-null money column in cents; with zero_default the database fills in 0 when the INSERT omits it."""
+    return Column(Cents(), nullable=False, server_default=text("0") if zero_default else None)
+
+
+def _zero_numeric_column() -> Column:
+    """Non-null NUMERIC column defaulting to 0.
+
+    Fields using it also default to 0 in Python, so new objects are usable before they are flushed;
+    the server default covers rows written outside the ORM, such as the summary trigger and raw SQL.
+    """
+    return Column(Numeric(18, 2), nullable=False, server_default=text("0"))
+
+
+def _timestamp_column(*, index: bool = False, onupdate: bool = False) -> Column:
+    """Non-null TIMESTAMPTZ column stamped by the database clock when the INSERT omits it."""
+    return Column(
+        UTCDateTime(),
+        nullable=False,
+        index=index,
+        server_default=func.now(),
+        onupdate=func.now() if onupdate else None,
+    )
+
+
+def _text_column() -> Column:
+    """Non-null free-text column defaulting to an empty string; length limits live on the *Create schemas."""
+    return Column(Text, nullable=False, server_default="")
+
+
+def _unique_per_year_index(name: str, number_column: str, date_column: str) -> Index:
+    """Unique index on a document number within the UTC calendar year of the document date.
+
+    Sharding the uniqueness by year keeps each year's numbering independent and lets old years' entries
+    sit cold instead of one ever-growing B-tree. AT TIME ZONE makes the expression immutable for TIMESTAMPTZ.
+    """
+    return Index(name, number_column, text(f"(extract(year from ({date_column} AT TIME ZONE 'UTC')))"), unique=True)
+
+
+def _brin_date_index(name: str, date_column: str) -> Index:
+    """BRIN index for date range scans on an append-only table whose rows arrive in date order.
+
+    It stores one min/max summary per 32 heap pages instead of an entry per row, so it stays a tiny
+    fraction of a B-tree's size while still skipping every block range outside the requested dates.
+    """
+    return Index(name, date_column, postgresql_using="brin", postgresql_with={"pages_per_range": 32})
+
+
+# Table models are not validated by pydantic, so value constraints (ge/gt) live on the *Create/*Update
+# schemas; table fields only carry what shapes the database column (max_length -> VARCHAR(n)).
+
+
 # Product/Inventory Management
 class Product(SQLModel, table=True):
     __tablename__ = "products"  # type: ignore[assignment]
+    __table_args__ = (
+        # Listing screens only show active products ordered by name; the partial covering index
+        # keeps those queries index-only without a separate sort.
+        Index(
+            "ix_products_active_name",
+            "name",
+            postgresql_where=text("is_active"),
+            postgresql_include=["code", "selling_price"],
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, max_length=50, index=True)
     name: str = Field(max_length=200)
-    description: str = Field(default="", max_length=1000)
+    description: str = Field(default="", sa_column=_text_column())
     unit: str = Field(max_length=20)  # pcs, kg, liter, etc.
-    purchase_price: Decimal = Field(decimal_places=2, ge=0)
-    selling_price: Decimal = Field(decimal_places=2, ge=0)
-    stock_quantity: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    minimum_stock: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
+    purchase_price: Decimal = Field(sa_column=_money_column())
+    selling_price: Decimal = Field(sa_column=_money_column())
+    stock_quantity: Decimal = Field(default=Decimal("0"), sa_column=_zero_numeric_column())
+    minimum_stock: Decimal = Field(default=Decimal("0"), sa_column=_zero_numeric_column())
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
-    # Relationships
-    purchase_items: List["PurchaseItem"] = Relationship(back_populates="product")
-    sale_items: List["SaleItem"] = Relationship(back_populates="product")
-    stock_movements: List["StockMovement"] = Relationship(back_populates="product")
+    # Relationships (history collections are unbounded, so they stay lazy)
+    purchase_items: List["PurchaseItem"] = Relationship(
+        back_populates="product", sa_relationship_kwargs={"lazy": "select"}
+    )
+    sale_items: List["SaleItem"] = Relationship(back_populates="product", sa_relationship_kwargs={"lazy": "select"})
+    stock_movements: List["StockMovement"] = Relationship(
+        back_populates="product", sa_relationship_kwargs={"lazy": "select"}
+    )
+
+
+# Denormalized read model for product listing and POS lookup screens. Rows are kept in sync
+# with `products` by a database trigger, so every write path (ORM or bulk SQL) maintains it.
+class ProductSummary(SQLModel, table=True):
+    __tablename__ = "product_summaries"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_product_summaries_active_name", "is_active", "name"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    product_id: int = Field(foreign_key="products.id", unique=True, ondelete="CASCADE")
+    code: str = Field(max_length=50)
+    name: str = Field(max_length=200)
+    selling_price: Decimal = Field(sa_column=_money_column())
+    stock_quantity: Decimal = Field(default=Decimal("0"), sa_column=_zero_numeric_column())
+    is_active: bool = Field(default=True)
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
+
+
+event.listen(
+    ProductSummary.__table__,  # type: ignore[attr-defined]
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION sync_product_summary() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO product_summaries (product_id, code, name, selling_price, stock_quantity, is_active, updated_at)
+            VALUES (NEW.id, NEW.code, NEW.name, NEW.selling_price, NEW.stock_quantity, NEW.is_active, now())
+            ON CONFLICT (product_id) DO UPDATE SET
+                code = EXCLUDED.code,
+                name = EXCLUDED.name,
+                selling_price = EXCLUDED.selling_price,
+                stock_quantity = EXCLUDED.stock_quantity,
+                is_active = EXCLUDED.is_active,
+                updated_at = EXCLUDED.updated_at;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS trg_products_sync_summary ON products;
+        CREATE TRIGGER trg_products_sync_summary
+            AFTER INSERT OR UPDATE OF code, name, selling_price, stock_quantity, is_active ON products
+            FOR EACH ROW EXECUTE FUNCTION sync_product_summary();
+
+        INSERT INTO product_summaries (product_id, code, name, selling_price, stock_quantity, is_active, updated_at)
+        SELECT id, code, name, selling_price, stock_quantity, is_active, now() FROM products
+        ON CONFLICT (product_id) DO NOTHING;
+        """
+    ).execute_if(dialect="postgresql"),
+)
 
 
 # Customer Management
 class Customer(SQLModel, table=True):
     __tablename__ = "customers"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_customers_active_name", "name", postgresql_where=text("is_active"), postgresql_include=["code"]),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, max_length=50, index=True)
     name: str = Field(max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
     phone: Optional[str] = Field(default=None, max_length=20)
-    address: str = Field(default="", max_length=500)
-    credit_limit: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    current_balance: Decimal = Field(default=Decimal("0"), decimal_places=2)  # Outstanding receivables
+    address: str = Field(default="", sa_column=_text_column())
+    credit_limit: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    current_balance: Decimal = Field(
+        default=Decimal("0"), sa_column=_money_column(zero_default=True)
+    )  # Outstanding receivables
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
-    sales: List["Sale"] = Relationship(back_populates="customer")
-    receivable_payments: List["ReceivablePayment"] = Relationship(back_populates="customer")
+    sales: List["Sale"] = Relationship(back_populates="customer", sa_relationship_kwargs={"lazy": "select"})
+    receivable_payments: List["ReceivablePayment"] = Relationship(
+        back_populates="customer", sa_relationship_kwargs={"lazy": "select"}
+    )
 
 
 # Supplier Management
 class Supplier(SQLModel, table=True):
     __tablename__ = "suppliers"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_suppliers_active_name", "name", postgresql_where=text("is_active"), postgresql_include=["code"]),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     code: str = Field(unique=True, max_length=50, index=True)
     name: str = Field(max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
     phone: Optional[str] = Field(default=None, max_length=20)
-    address: str = Field(default="", max_length=500)
-    current_balance: Decimal = Field(default=Decimal("0"), decimal_places=2)  # Outstanding payables
+    address: str = Field(default="", sa_column=_text_column())
+    current_balance: Decimal = Field(
+        default=Decimal("0"), sa_column=_money_column(zero_default=True)
+    )  # Outstanding payables
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
-    purchases: List["Purchase"] = Relationship(back_populates="supplier")
-    payable_payments: List["PayablePayment"] = Relationship(back_populates="supplier")
+    purchases: List["Purchase"] = Relationship(back_populates="supplier", sa_relationship_kwargs={"lazy": "select"})
+    payable_payments: List["PayablePayment"] = Relationship(
+        back_populates="supplier", sa_relationship_kwargs={"lazy": "select"}
+    )
 
 
 # Purchase Transaction from Suppliers
 class Purchase(SQLModel, table=True):
     __tablename__ = "purchases"  # type: ignore[assignment]
+    __table_args__ = (
+        _unique_per_year_index("uq_purchases_invoice_number_year", "invoice_number", "transaction_date"),
+        # Per-supplier statements: filter and sort straight from the index
+        Index(
+            "ix_purchases_supplier_date",
+            "supplier_id",
+            desc("transaction_date"),
+            postgresql_include=["total_amount", "paid_amount", "payment_status"],
+        ),
+        Index(
+            "ix_purchases_unpaid",
+            "supplier_id",
+            desc("transaction_date"),
+            postgresql_where=text("payment_status <> 'paid'"),
+        ),
+        Index(
+            "ix_purchases_due", "due_date", postgresql_where=text("payment_status IN ('pending', 'partial', 'overdue')")
+        ),
+        Index("ix_purchases_open", "supplier_id", "due_date", postgresql_where=text("outstanding_amount > 0")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    invoice_number: str = Field(unique=True, max_length=100, index=True)
+    invoice_number: str = Field(max_length=100)
     supplier_id: int = Field(foreign_key="suppliers.id")
-    transaction_date: datetime = Field(default_factory=datetime.utcnow, index=True)
-    due_date: Optional[datetime] = Field(default=None, index=True)
-    subtotal: Decimal = Field(decimal_places=2, ge=0)
-    tax_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    total_amount: Decimal = Field(decimal_places=2, ge=0)
-    paid_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    payment_status: PaymentStatus = Field(default=PaymentStatus.PENDING)
-    notes: str = Field(default="", max_length=1000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    transaction_date: datetime = Field(sa_column=_timestamp_column(index=True))
+    due_date: Optional[datetime] = Field(default=None, sa_column=Column(UTCDateTime()))
+    subtotal: Decimal = Field(sa_column=_money_column())
+    tax_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    discount_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    total_amount: Decimal = Field(sa_column=_money_column())
+    paid_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    # Maintained by PostgreSQL (GENERATED ALWAYS ... STORED); never written by the application
+    outstanding_amount: Optional[Decimal] = Field(
+        default=None, sa_column=Column(Cents(), Computed("total_amount - paid_amount", persisted=True))
+    )
+    payment_status: PaymentStatus = Field(
+        default=PaymentStatus.PENDING,
+        sa_column=Column(PAYMENT_STATUS_ENUM, nullable=False, server_default=PaymentStatus.PENDING.value),
+    )
+    notes: str = Field(default="", sa_column=_text_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
-    supplier: Supplier = Relationship(back_populates="purchases")
-    purchase_items: List["PurchaseItem"] = Relationship(back_populates="purchase")
-    payable_payments: List["PayablePayment"] = Relationship(back_populates="purchase")
+    supplier: Supplier = Relationship(
+        back_populates="purchases", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
+    purchase_items: List["PurchaseItem"] = Relationship(
+        back_populates="purchase", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    payable_payments: List["PayablePayment"] = Relationship(
+        back_populates="purchase", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class PurchaseItem(SQLModel, table=True):
@@ -120,39 +353,70 @@ class PurchaseItem(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     purchase_id: int = Field(foreign_key="purchases.id")
     product_id: int = Field(foreign_key="products.id")
-    quantity: Decimal = Field(decimal_places=2, gt=0)
-    unit_price: Decimal = Field(decimal_places=2, ge=0)
-    discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    total_amount: Decimal = Field(decimal_places=2, ge=0)
+    quantity: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    unit_price: Decimal = Field(sa_column=_money_column())
+    discount_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    total_amount: Decimal = Field(sa_column=_money_column())
 
-    # Relationships
-    purchase: Purchase = Relationship(back_populates="purchase_items")
-    product: Product = Relationship(back_populates="purchase_items")
+    # Relationships (the parent back-reference is served from the identity map)
+    purchase: Purchase = Relationship(back_populates="purchase_items", sa_relationship_kwargs={"lazy": "select"})
+    product: Product = Relationship(
+        back_populates="purchase_items", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 # Sales Transaction to Customers
 class Sale(SQLModel, table=True):
     __tablename__ = "sales"  # type: ignore[assignment]
+    __table_args__ = (
+        _unique_per_year_index("uq_sales_invoice_number_year", "invoice_number", "transaction_date"),
+        # Per-customer statements: filter and sort straight from the index
+        Index(
+            "ix_sales_customer_date",
+            "customer_id",
+            desc("transaction_date"),
+            postgresql_include=["total_amount", "paid_amount", "payment_status"],
+        ),
+        Index(
+            "ix_sales_unpaid",
+            "customer_id",
+            desc("transaction_date"),
+            postgresql_where=text("payment_status <> 'paid'"),
+        ),
+        Index("ix_sales_due", "due_date", postgresql_where=text("payment_status IN ('pending', 'partial', 'overdue')")),
+        Index("ix_sales_open", "customer_id", "due_date", postgresql_where=text("outstanding_amount > 0")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    invoice_number: str = Field(unique=True, max_length=100, index=True)
+    invoice_number: str = Field(max_length=100)
     customer_id: int = Field(foreign_key="customers.id")
-    transaction_date: datetime = Field(default_factory=datetime.utcnow, index=True)
-    due_date: Optional[datetime] = Field(default=None, index=True)
-    subtotal: Decimal = Field(decimal_places=2, ge=0)
-    tax_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    total_amount: Decimal = Field(decimal_places=2, ge=0)
-    paid_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    payment_status: PaymentStatus = Field(default=PaymentStatus.PENDING)
-    notes: str = Field(default="", max_length=1000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    transaction_date: datetime = Field(sa_column=_timestamp_column(index=True))
+    due_date: Optional[datetime] = Field(default=None, sa_column=Column(UTCDateTime()))
+    subtotal: Decimal = Field(sa_column=_money_column())
+    tax_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    discount_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    total_amount: Decimal = Field(sa_column=_money_column())
+    paid_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    # Maintained by PostgreSQL (GENERATED ALWAYS ... STORED); never written by the application
+    outstanding_amount: Optional[Decimal] = Field(
+        default=None, sa_column=Column(Cents(), Computed("total_amount - paid_amount", persisted=True))
+    )
+    payment_status: PaymentStatus = Field(
+        default=PaymentStatus.PENDING,
+        sa_column=Column(PAYMENT_STATUS_ENUM, nullable=False, server_default=PaymentStatus.PENDING.value),
+    )
+    notes: str = Field(default="", sa_column=_text_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
-    customer: Customer = Relationship(back_populates="sales")
-    sale_items: List["SaleItem"] = Relationship(back_populates="sale")
-    receivable_payments: List["ReceivablePayment"] = Relationship(back_populates="sale")
+    customer: Customer = Relationship(
+        back_populates="sales", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
+    sale_items: List["SaleItem"] = Relationship(back_populates="sale", sa_relationship_kwargs={"lazy": "selectin"})
+    receivable_payments: List["ReceivablePayment"] = Relationship(
+        back_populates="sale", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class SaleItem(SQLModel, table=True):
@@ -161,81 +425,143 @@ class SaleItem(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     sale_id: int = Field(foreign_key="sales.id")
     product_id: int = Field(foreign_key="products.id")
-    quantity: Decimal = Field(decimal_places=2, gt=0)
-    unit_price: Decimal = Field(decimal_places=2, ge=0)
-    discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    total_amount: Decimal = Field(decimal_places=2, ge=0)
+    quantity: Decimal = Field(sa_column=Column(Numeric(18, 2), nullable=False))
+    unit_price: Decimal = Field(sa_column=_money_column())
+    discount_amount: Decimal = Field(default=Decimal("0"), sa_column=_money_column(zero_default=True))
+    total_amount: Decimal = Field(sa_column=_money_column())
 
-    # Relationships
-    sale: Sale = Relationship(back_populates="sale_items")
-    product: Product = Relationship(back_populates="sale_items")
+    # Relationships (the parent back-reference is served from the identity map)
+    sale: Sale = Relationship(back_populates="sale_items", sa_relationship_kwargs={"lazy": "select"})
+    product: Product = Relationship(
+        back_populates="sale_items", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 # Stock Movement Tracking
 class StockMovement(SQLModel, table=True):
     __tablename__ = "stock_movements"  # type: ignore[assignment]
+    __table_args__ = (
+        # Stock ledger: one product's movements, newest first, served index-only
+        Index(
+            "ix_stock_movements_product_date",
+            "product_id",
+            desc("movement_date"),
+            postgresql_include=["quantity_in", "quantity_out", "unit_cost", "reference_number"],
+        ),
+        _brin_date_index("ix_stock_movements_movement_date_brin", "movement_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     product_id: int = Field(foreign_key="products.id")
-    transaction_type: TransactionType
+    transaction_type: TransactionType = Field(sa_column=Column(TRANSACTION_TYPE_ENUM, nullable=False))
     reference_id: int  # ID of purchase or sale
     reference_number: str = Field(max_length=100)  # Invoice number
-    quantity_in: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    quantity_out: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
-    balance_after: Decimal = Field(decimal_places=2, ge=0)
-    unit_cost: Decimal = Field(decimal_places=2, ge=0)
-    notes: str = Field(default="", max_length=500)
-    movement_date: datetime = Field(default_factory=datetime.utcnow, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    quantity_in: Decimal = Field(default=Decimal("0"), sa_column=_zero_numeric_column())
+    quantity_out: Decimal = Field(default=Decimal("0"), sa_column=_zero_numeric_column())
+    unit_cost: Decimal = Field(sa_column=_money_column())
+    notes: str = Field(default="", sa_column=_text_column())
+    movement_date: datetime = Field(sa_column=_timestamp_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     # Relationships
-    product: Product = Relationship(back_populates="stock_movements")
+    product: Product = Relationship(
+        back_populates="stock_movements", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 # Payment Management for Supplier Debts (Accounts Payable)
 class PayablePayment(SQLModel, table=True):
     __tablename__ = "payable_payments"  # type: ignore[assignment]
+    __table_args__ = (
+        _unique_per_year_index("uq_payable_payments_payment_number_year", "payment_number", "payment_date"),
+        Index(
+            "ix_payable_payments_supplier_date",
+            "supplier_id",
+            desc("payment_date"),
+            postgresql_include=["payment_amount"],
+        ),
+        _brin_date_index("ix_payable_payments_payment_date_brin", "payment_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    payment_number: str = Field(unique=True, max_length=100, index=True)
+    payment_number: str = Field(max_length=100)
     supplier_id: int = Field(foreign_key="suppliers.id")
     purchase_id: Optional[int] = Field(default=None, foreign_key="purchases.id")
-    payment_date: datetime = Field(default_factory=datetime.utcnow, index=True)
-    payment_amount: Decimal = Field(decimal_places=2, gt=0)
-    payment_type: PaymentType = Field(default=PaymentType.CASH)
+    payment_date: datetime = Field(sa_column=_timestamp_column())
+    payment_amount: Decimal = Field(sa_column=_money_column())
+    payment_type: PaymentType = Field(
+        default=PaymentType.CASH,
+        sa_column=Column(PAYMENT_TYPE_ENUM, nullable=False, server_default=PaymentType.CASH.value),
+    )
     reference_number: str = Field(default="", max_length=100)  # Check number, transfer ref, etc.
-    notes: str = Field(default="", max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    notes: str = Field(default="", sa_column=_text_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     # Relationships
-    supplier: Supplier = Relationship(back_populates="payable_payments")
-    purchase: Optional[Purchase] = Relationship(back_populates="payable_payments")
+    supplier: Supplier = Relationship(
+        back_populates="payable_payments", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
+    purchase: Optional[Purchase] = Relationship(
+        back_populates="payable_payments", sa_relationship_kwargs={"lazy": "select"}
+    )
 
 
 # Payment Management for Customer Receivables (Accounts Receivable)
 class ReceivablePayment(SQLModel, table=True):
     __tablename__ = "receivable_payments"  # type: ignore[assignment]
+    __table_args__ = (
+        _unique_per_year_index("uq_receivable_payments_payment_number_year", "payment_number", "payment_date"),
+        Index(
+            "ix_receivable_payments_customer_date",
+            "customer_id",
+            desc("payment_date"),
+            postgresql_include=["payment_amount"],
+        ),
+        _brin_date_index("ix_receivable_payments_payment_date_brin", "payment_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    payment_number: str = Field(unique=True, max_length=100, index=True)
+    payment_number: str = Field(max_length=100)
     customer_id: int = Field(foreign_key="customers.id")
     sale_id: Optional[int] = Field(default=None, foreign_key="sales.id")
-    payment_date: datetime = Field(default_factory=datetime.utcnow, index=True)
-    payment_amount: Decimal = Field(decimal_places=2, gt=0)
-    payment_type: PaymentType = Field(default=PaymentType.CASH)
+    payment_date: datetime = Field(sa_column=_timestamp_column())
+    payment_amount: Decimal = Field(sa_column=_money_column())
+    payment_type: PaymentType = Field(
+        default=PaymentType.CASH,
+        sa_column=Column(PAYMENT_TYPE_ENUM, nullable=False, server_default=PaymentType.CASH.value),
+    )
     reference_number: str = Field(default="", max_length=100)  # Check number, transfer ref, etc.
-    notes: str = Field(default="", max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    notes: str = Field(default="", sa_column=_text_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     # Relationships
-    customer: Customer = Relationship(back_populates="receivable_payments")
-    sale: Optional[Sale] = Relationship(back_populates="receivable_payments")
+    customer: Customer = Relationship(
+        back_populates="receivable_payments", sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
+    sale: Optional[Sale] = Relationship(back_populates="receivable_payments", sa_relationship_kwargs={"lazy": "select"})
+
+
+# Balances, stock and payment state are updated in place on every invoice and payment. Leaving 20% of
+# each heap page free lets PostgreSQL write the new row version on the same page, and as a HOT update
+# (no index writes) when none of the changed columns is indexed.
+for _table in (Product, ProductSummary, Customer, Supplier, Purchase, Sale):
+    event.listen(
+        _table.__table__,  # type: ignore[attr-defined]
+        "after_create",
+        DDL("ALTER TABLE %(table)s SET (fillfactor = 80)").execute_if(dialect="postgresql"),
+    )
 
 
 # Non-persistent schemas for validation and forms
 
 
-class ProductCreate(SQLModel, table=False):
+class _InputSchema(SQLModel):
+    """Base for *Create/*Update schemas: unknown fields are rejected instead of silently dropped."""
+
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
+
+class ProductCreate(_InputSchema, table=False):
     code: str = Field(max_length=50)
     name: str = Field(max_length=200)
     description: str = Field(default="", max_length=1000)
@@ -245,7 +571,7 @@ class ProductCreate(SQLModel, table=False):
     minimum_stock: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
 
 
-class ProductUpdate(SQLModel, table=False):
+class ProductUpdate(_InputSchema, table=False):
     name: Optional[str] = Field(default=None, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     unit: Optional[str] = Field(default=None, max_length=20)
@@ -255,7 +581,7 @@ class ProductUpdate(SQLModel, table=False):
     is_active: Optional[bool] = Field(default=None)
 
 
-class CustomerCreate(SQLModel, table=False):
+class CustomerCreate(_InputSchema, table=False):
     code: str = Field(max_length=50)
     name: str = Field(max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
@@ -264,7 +590,7 @@ class CustomerCreate(SQLModel, table=False):
     credit_limit: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
 
 
-class CustomerUpdate(SQLModel, table=False):
+class CustomerUpdate(_InputSchema, table=False):
     name: Optional[str] = Field(default=None, max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
     phone: Optional[str] = Field(default=None, max_length=20)
@@ -273,7 +599,7 @@ class CustomerUpdate(SQLModel, table=False):
     is_active: Optional[bool] = Field(default=None)
 
 
-class SupplierCreate(SQLModel, table=False):
+class SupplierCreate(_InputSchema, table=False):
     code: str = Field(max_length=50)
     name: str = Field(max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
@@ -281,7 +607,7 @@ class SupplierCreate(SQLModel, table=False):
     address: str = Field(default="", max_length=500)
 
 
-class SupplierUpdate(SQLModel, table=False):
+class SupplierUpdate(_InputSchema, table=False):
     name: Optional[str] = Field(default=None, max_length=200)
     email: Optional[str] = Field(default=None, max_length=255)
     phone: Optional[str] = Field(default=None, max_length=20)
@@ -289,14 +615,14 @@ class SupplierUpdate(SQLModel, table=False):
     is_active: Optional[bool] = Field(default=None)
 
 
-class PurchaseItemCreate(SQLModel, table=False):
+class PurchaseItemCreate(_InputSchema, table=False):
     product_id: int
     quantity: Decimal = Field(decimal_places=2, gt=0)
     unit_price: Decimal = Field(decimal_places=2, ge=0)
     discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
 
 
-class PurchaseCreate(SQLModel, table=False):
+class PurchaseCreate(_InputSchema, table=False):
     invoice_number: str = Field(max_length=100)
     supplier_id: int
     transaction_date: datetime
@@ -307,14 +633,14 @@ class PurchaseCreate(SQLModel, table=False):
     items: List[PurchaseItemCreate]
 
 
-class SaleItemCreate(SQLModel, table=False):
+class SaleItemCreate(_InputSchema, table=False):
     product_id: int
     quantity: Decimal = Field(decimal_places=2, gt=0)
     unit_price: Decimal = Field(decimal_places=2, ge=0)
     discount_amount: Decimal = Field(default=Decimal("0"), decimal_places=2, ge=0)
 
 
-class SaleCreate(SQLModel, table=False):
+class SaleCreate(_InputSchema, table=False):
     invoice_number: str = Field(max_length=100)
     customer_id: int
     transaction_date: datetime
@@ -325,7 +651,7 @@ class SaleCreate(SQLModel, table=False):
     items: List[SaleItemCreate]
 
 
-class PayablePaymentCreate(SQLModel, table=False):
+class PayablePaymentCreate(_InputSchema, table=False):
     payment_number: str = Field(max_length=100)
     supplier_id: int
     purchase_id: Optional[int] = Field(default=None)
@@ -336,7 +662,7 @@ class PayablePaymentCreate(SQLModel, table=False):
     notes: str = Field(default="", max_length=500)
 
 
-class ReceivablePaymentCreate(SQLModel, table=False):
+class ReceivablePaymentCreate(_InputSchema, table=False):
     payment_number: str = Field(max_length=100)
     customer_id: int
     sale_id: Optional[int] = Field(default=None)
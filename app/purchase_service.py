@@ -0,0 +1,24 @@
+from typing import Optional
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.database import get_session, query_with_loaders
+from app.invoice_service import create_invoice
+from app.models import Purchase, PurchaseCreate, PurchaseItem, Supplier, TransactionType
+
+
+async def create_purchase(data: PurchaseCreate) -> Purchase:
+    """Create a purchase with its line items, stock movements and supplier payable in one transaction."""
+    return await create_invoice(data, Purchase, PurchaseItem, Supplier, TransactionType.PURCHASE)
+
+
+def get_purchase(purchase_id: int) -> Optional[Purchase]:
+    """Load a purchase with its supplier and line items (with products) for display."""
+    query = query_with_loaders(
+        Purchase,
+        joinedload(Purchase.supplier),  # type: ignore[arg-type]
+        selectinload(Purchase.purchase_items).joinedload(PurchaseItem.product),  # type: ignore[arg-type]
+    ).where(Purchase.id == purchase_id)
+
+    with get_session() as session:
+        return session.exec(query).first()
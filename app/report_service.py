@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlmodel import Numeric, Session, cast, col, desc, func, literal, select, text
+
+from app.database import DEFAULT_LOADER, get_session, query_with_loaders
+from app.models import (
+    Customer,
+    Product,
+    Purchase,
+    Sale,
+    StockMovement,
+    StockReportItem,
+    Supplier,
+)
+
+# The stock report loads each entity level with its own query (rows, then the referenced products keyed by id)
+# and stitches them together in Python, instead of one wide join that repeats every parent column per row.
+# The payable/receivable reports have Postgres build the finished rows as one JSON array in a single query.
+
+
+def _products_by_id(session: Session, product_ids: set[int]) -> Dict[int, Product]:
+    if not product_ids:
+        return {}
+    products = session.exec(query_with_loaders(Product).where(col(Product.id).in_(product_ids))).all()
+    return {product.id: product for product in products if product.id is not None}
+
+
+def _cents_as_amount(column: Any) -> Any:
+    """Money columns hold integer cents; expose them to JSON as a two-decimal amount."""
+    return func.round(cast(column, Numeric) / 100, 2)
+
+
+def _json_rows(fields: Dict[str, Any], *order_by: Any) -> Any:
+    """Aggregate the selected rows into one JSON array, each row shaped into an object by Postgres."""
+    row = func.jsonb_build_object(*[part for key, value in fields.items() for part in (literal(key), value)])
+    return func.coalesce(func.jsonb_agg(aggregate_order_by(row, *order_by)), text("'[]'::jsonb"))
+
+
+def get_stock_report(
+    product_id: Optional[int] = None, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+) -> List[StockReportItem]:
+    """Stock ledger lines in chronological order, optionally limited to one product and a date range.
+
+    balance_after is derived at query time and anchored to the product's current stock_quantity, since
+    products may carry opening stock with no movement behind it. A stock edit made without a matching
+    movement therefore shifts the reported balance of every earlier ledger line by the same amount.
+    """
+    change = col(StockMovement.quantity_in) - col(StockMovement.quantity_out)
+
+    # Stock level just before the range: current stock minus every movement from start_date on,
+    # one grouped aggregate per product that only touches the dated tail of the ledger.
+    opening_query = (
+        select(
+            col(StockMovement.product_id).label("product_id"),
+            (col(Product.stock_quantity) - func.sum(change)).label("opening_balance"),
+        )
+        .join(Product, col(Product.id) == col(StockMovement.product_id))
+        .group_by(col(StockMovement.product_id), col(Product.stock_quantity))
+    )
+    if product_id is not None:
+        opening_query = opening_query.where(StockMovement.product_id == product_id)
+    if start_date is not None:
+        opening_query = opening_query.where(StockMovement.movement_date >= start_date)
+    opening = opening_query.subquery("opening")
+
+    # The running sum then only has to window over the rows inside the range
+    running_change = func.sum(change).over(
+        partition_by=col(StockMovement.product_id),
+        order_by=[col(StockMovement.movement_date), col(StockMovement.id)],
+    )
+    query = (
+        select(StockMovement, (opening.c.opening_balance + running_change).label("balance_after"))
+        .join(opening, opening.c.product_id == col(StockMovement.product_id))
+        .options(DEFAULT_LOADER)
+    )
+    if product_id is not None:
+        query = query.where(StockMovement.product_id == product_id)
+    if start_date is not None:
+        query = query.where(StockMovement.movement_date >= start_date)
+    if end_date is not None:
+        query = query.where(StockMovement.movement_date <= end_date)
+    query = query.order_by(col(StockMovement.movement_date), col(StockMovement.id))
+
+    with get_session() as session:
+        rows = session.exec(query).all()
+        products = _products_by_id(session, {movement.product_id for movement, _ in rows})
+
+        return [
+            StockReportItem(
+                product_code=products[movement.product_id].code,
+                product_name=products[movement.product_id].name,
+                movement_date=movement.movement_date,
+                reference_number=movement.reference_number,
+                transaction_type=movement.transaction_type.value,
+                quantity_in=movement.quantity_in,
+                quantity_out=movement.quantity_out,
+                balance_after=balance,
+                unit_cost=movement.unit_cost,
+            )
+            for movement, balance in rows
+        ]
+
+
+def get_payable_report(supplier_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Purchases with an outstanding balance, newest first, optionally for a single supplier.
+
+    Rows are dicts with the PayableReportItem fields; dates come back as ISO 8601 strings.
+    """
+    fields = {
+        "supplier_code": Supplier.code,
+        "supplier_name": Supplier.name,
+        "invoice_number": Purchase.invoice_number,
+        "transaction_date": Purchase.transaction_date,
+        "due_date": Purchase.due_date,
+        "total_amount": _cents_as_amount(Purchase.total_amount),
+        "paid_amount": _cents_as_amount(Purchase.paid_amount),
+        "outstanding_amount": _cents_as_amount(Purchase.outstanding_amount),
+        "payment_status": Purchase.payment_status,
+    }
+    query = (
+        select(_json_rows(fields, desc(Purchase.transaction_date)))
+        .select_from(Purchase)
+        .join(Supplier, col(Supplier.id) == col(Purchase.supplier_id))
+        .where(col(Purchase.outstanding_amount) > 0)
+    )
+    if supplier_id is not None:
+        query = query.where(Purchase.supplier_id == supplier_id)
+
+    with get_session() as session:
+        return session.exec(query).one()
+
+
+def get_receivable_report(customer_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Sales with an outstanding balance, newest first, optionally for a single customer.
+
+    Rows are dicts with the ReceivableReportItem fields; dates come back as ISO 8601 strings.
+    """
+    fields = {
+        "customer_code": Customer.code,
+        "customer_name": Customer.name,
+        "invoice_number": Sale.invoice_number,
+        "transaction_date": Sale.transaction_date,
+        "due_date": Sale.due_date,
+        "total_amount": _cents_as_amount(Sale.total_amount),
+        "paid_amount": _cents_as_amount(Sale.paid_amount),
+        "outstanding_amount": _cents_as_amount(Sale.outstanding_amount),
+        "payment_status": Sale.payment_status,
+    }
+    query = (
+        select(_json_rows(fields, desc(Sale.transaction_date)))
+        .select_from(Sale)
+        .join(Customer, col(Customer.id) == col(Sale.customer_id))
+        .where(col(Sale.outstanding_amount) > 0)
+    )
+    if customer_id is not None:
+        query = query.where(Sale.customer_id == customer_id)
+
+    with get_session() as session:
+        return session.exec(query).one()
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.database import get_session, query_with_loaders
+from app.invoice_service import create_invoice
+from app.models import Customer, Sale, SaleCreate, SaleItem, TransactionType
+
+
+async def create_sale(data: SaleCreate) -> Sale:
+    """Create a sale with its line items, stock movements and customer receivable in one transaction."""
+    return await create_invoice(data, Sale, SaleItem, Customer, TransactionType.SALE)
+
+
+def get_sale(sale_id: int) -> Optional[Sale]:
+    """Load a sale with its customer and line items (with products) for display."""
+    query = query_with_loaders(
+        Sale,
+        joinedload(Sale.customer),  # type: ignore[arg-type]
+        selectinload(Sale.sale_items).joinedload(SaleItem.product),  # type: ignore[arg-type]
+    ).where(Sale.id == sale_id)
+
+    with get_session() as session:
+        return session.exec(query).first()
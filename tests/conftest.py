@@ -1,12 +1,38 @@
 from typing import Generator
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlmodel import Session
+from app.database import ASYNC_ENGINE, DEFAULT_LOADER, reset_db
 from app.startup import startup
 from nicegui.testing import User
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
 
+@event.listens_for(Session, "do_orm_execute")
+def _raise_on_implicit_relationship_loads(execute_state: ORMExecuteState) -> None:
+    """Apply the raiseload default to every top-level ORM SELECT so tests catch N+1 lazy loads."""
+    if execute_state.is_select and not execute_state.is_column_load and not execute_state.is_relationship_load:
+        execute_state.statement = execute_state.statement.options(DEFAULT_LOADER)
+
+
 @pytest.fixture
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+async def async_engine():
+    """Drop pooled asyncpg connections after each test; they belong to the test's event loop and schema"""
+    yield ASYNC_ENGINE
+    await ASYNC_ENGINE.dispose()
+
+
+@pytest.fixture()
+def clean_db(async_engine):
+    """Reset database for each test"""
+    reset_db()
+    yield
+    reset_db()
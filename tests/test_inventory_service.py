@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+from sqlalchemy import event
+
+from app.database import ENGINE, get_session
+from app.inventory_service import get_stock, list_product_summaries
+from app.models import Product
+
+
+def _create_product(code: str, name: str, is_active: bool = True) -> Product:
+    with get_session() as session:
+        product = Product(
+            code=code,
+            name=name,
+            unit="pcs",
+            purchase_price=Decimal("8.00"),
+            selling_price=Decimal("10.00"),
+            is_active=is_active,
+        )
+        session.add(product)
+        session.commit()
+        session.refresh(product)
+        return product
+
+
+def test_summary_created_with_product(clean_db):
+    product = _create_product("P-001", "Widget")
+
+    summaries = list_product_summaries()
+
+    assert len(summaries) == 1
+    assert summaries[0].product_id == product.id
+    assert summaries[0].code == "P-001"
+    assert summaries[0].selling_price == Decimal("10.00")
+    assert summaries[0].stock_quantity == Decimal("0")
+
+
+def test_summary_follows_product_updates(clean_db):
+    product = _create_product("P-001", "Widget")
+
+    with get_session() as session:
+        db_product = session.get(Product, product.id)
+        assert db_product is not None
+        db_product.name = "Widget XL"
+        db_product.stock_quantity = Decimal("12.50")
+        session.commit()
+
+    summaries = list_product_summaries()
+    assert summaries[0].name == "Widget XL"
+    assert summaries[0].stock_quantity == Decimal("12.50")
+
+
+def test_list_excludes_inactive_and_orders_by_name(clean_db):
+    _create_product("P-002", "Bolt")
+    _create_product("P-001", "Anchor")
+    _create_product("P-003", "Retired", is_active=False)
+
+    assert [s.name for s in list_product_summaries()] == ["Anchor", "Bolt"]
+    assert len(list_product_summaries(include_inactive=True)) == 3
+
+
+def test_list_search_matches_code_or_name(clean_db):
+    _create_product("BOLT-10", "Hex bolt")
+    _create_product("NUT-10", "Hex nut")
+
+    assert [s.code for s in list_product_summaries(search="bolt")] == ["BOLT-10"]
+    assert len(list_product_summaries(search="hex")) == 2
+    assert list_product_summaries(search="washer") == []
+
+
+def test_get_stock_reads_through_and_skips_unknown_ids(clean_db):
+    product = _create_product("P-001", "Widget")
+    assert product.id is not None
+
+    assert get_stock([product.id, 9999]) == {product.id: Decimal("0")}
+
+
+def test_get_stock_invalidated_by_product_update(clean_db):
+    product = _create_product("P-001", "Widget")
+    assert product.id is not None
+    assert get_stock([product.id]) == {product.id: Decimal("0")}
+
+    with get_session() as session:
+        db_product = session.get(Product, product.id)
+        assert db_product is not None
+        db_product.stock_quantity = Decimal("7")
+        session.commit()
+
+    assert get_stock([product.id]) == {product.id: Decimal("7")}
+
+
+def test_get_stock_fill_does_not_overwrite_newer_commit(clean_db):
+    product = _create_product("P-001", "Widget")
+    assert product.id is not None
+
+    pending = [Decimal("7")]
+
+    def commit_stock_change_after_read(*_args) -> None:
+        # Runs right after get_stock's SELECT, before it fills the cache with what it read
+        if not pending:
+            return
+        quantity = pending.pop()
+        with get_session() as session:
+            db_product = session.get(Product, product.id)
+            assert db_product is not None
+            db_product.stock_quantity = quantity
+            session.commit()
+
+    event.listen(ENGINE, "after_cursor_execute", commit_stock_change_after_read)
+    try:
+        assert get_stock([product.id]) == {product.id: Decimal("0")}
+    finally:
+        event.remove(ENGINE, "after_cursor_execute", commit_stock_change_after_read)
+    assert get_stock([product.id]) == {product.id: Decimal("7")}
+
+
+def test_new_product_defaults_usable_before_flush():
+    product = Product(code="P-001", name="Widget", unit="pcs", purchase_price=Decimal("1"), selling_price=Decimal("2"))
+
+    product.stock_quantity += Decimal("3")
+
+    assert product.stock_quantity == Decimal("3")
+    assert product.description == ""
+    assert product.created_at is None
@@ -0,0 +1,107 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import Product, PurchaseCreate, PurchaseItemCreate, StockMovement, Supplier, TransactionType
+from app.purchase_service import create_purchase, get_purchase
+
+
+@pytest.fixture()
+def catalog(clean_db):
+    with get_session() as session:
+        supplier = Supplier(code="S-001", name="Acme Supply")
+        bolt = Product(
+            code="BOLT", name="Bolt", unit="pcs", purchase_price=Decimal("1.00"), selling_price=Decimal("2.00")
+        )
+        nut = Product(code="NUT", name="Nut", unit="pcs", purchase_price=Decimal("0.50"), selling_price=Decimal("1.00"))
+        session.add_all([supplier, bolt, nut])
+        session.commit()
+        for obj in (supplier, bolt, nut):
+            session.refresh(obj)
+        return {"supplier": supplier, "bolt": bolt, "nut": nut}
+
+
+def _purchase_data(catalog, **overrides) -> PurchaseCreate:
+    values = {
+        "invoice_number": "PO-001",
+        "supplier_id": catalog["supplier"].id,
+        "transaction_date": datetime(2024, 3, 1, 10, 0),
+        "tax_amount": Decimal("1.50"),
+        "discount_amount": Decimal("0.50"),
+        "items": [
+            PurchaseItemCreate(product_id=catalog["bolt"].id, quantity=Decimal("10"), unit_price=Decimal("1.00")),
+            PurchaseItemCreate(
+                product_id=catalog["nut"].id,
+                quantity=Decimal("20"),
+                unit_price=Decimal("0.50"),
+                discount_amount=Decimal("1.00"),
+            ),
+        ],
+    }
+    values.update(overrides)
+    return PurchaseCreate(**values)
+
+
+async def test_create_purchase_totals_and_items(catalog):
+    purchase = await create_purchase(_purchase_data(catalog))
+
+    assert purchase.id is not None
+    assert purchase.subtotal == Decimal("19.00")
+    assert purchase.total_amount == Decimal("20.00")
+    assert sorted(item.total_amount for item in purchase.purchase_items) == [Decimal("9.00"), Decimal("10.00")]
+
+
+async def test_create_purchase_adds_stock_and_payable(catalog):
+    purchase = await create_purchase(_purchase_data(catalog))
+
+    with get_session() as session:
+        bolt = session.get(Product, catalog["bolt"].id)
+        supplier = session.get(Supplier, catalog["supplier"].id)
+        movements = session.exec(select(StockMovement).where(StockMovement.reference_id == purchase.id)).all()
+
+        assert bolt is not None and bolt.stock_quantity == Decimal("10")
+        assert supplier is not None and supplier.current_balance == Decimal("20.00")
+        assert len(movements) == 2
+        assert all(m.transaction_type == TransactionType.PURCHASE for m in movements)
+        bolt_movement = next(m for m in movements if m.product_id == catalog["bolt"].id)
+        assert bolt_movement.quantity_in == Decimal("10")
+        assert bolt_movement.unit_cost == Decimal("1.00")
+
+
+async def test_create_purchase_unknown_product_rolls_back(catalog):
+    data = _purchase_data(
+        catalog, items=[PurchaseItemCreate(product_id=9999, quantity=Decimal("1"), unit_price=Decimal("1.00"))]
+    )
+
+    with pytest.raises(ValueError, match="Product 9999 not found"):
+        await create_purchase(data)
+
+    with get_session() as session:
+        supplier = session.get(Supplier, catalog["supplier"].id)
+        assert supplier is not None and supplier.current_balance == Decimal("0")
+        assert session.exec(select(StockMovement)).all() == []
+
+
+async def test_create_purchase_requires_items(catalog):
+    with pytest.raises(ValueError, match="at least one item"):
+        await create_purchase(_purchase_data(catalog, items=[]))
+
+
+async def test_get_purchase_loads_supplier_and_items(catalog):
+    created = await create_purchase(_purchase_data(catalog))
+
+    assert created.id is not None
+    purchase = get_purchase(created.id)
+
+    assert purchase is not None
+    assert purchase.supplier.code == catalog["supplier"].code
+    assert {item.product.code for item in purchase.purchase_items} == {
+        p.code for p in [catalog[k] for k in catalog if k != "supplier"]
+    }
+
+
+def test_get_purchase_missing(clean_db):
+    assert get_purchase(9999) is None
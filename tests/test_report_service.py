@@ -0,0 +1,121 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import (
+    Customer,
+    PaymentStatus,
+    Product,
+    PurchaseCreate,
+    PurchaseItemCreate,
+    Sale,
+    SaleCreate,
+    SaleItemCreate,
+    Supplier,
+)
+from app.purchase_service import create_purchase
+from app.report_service import get_payable_report, get_receivable_report, get_stock_report
+from app.sale_service import create_sale
+
+
+@pytest.fixture()
+async def trading_data(clean_db):
+    with get_session() as session:
+        supplier = Supplier(code="S-001", name="Acme Supply")
+        customer = Customer(code="C-001", name="Jane Doe")
+        other_customer = Customer(code="C-002", name="John Roe")
+        bolt = Product(
+            code="BOLT", name="Bolt", unit="pcs", purchase_price=Decimal("1.00"), selling_price=Decimal("2.00")
+        )
+        session.add_all([supplier, customer, other_customer, bolt])
+        session.commit()
+        ids: dict[str, int] = {}
+        for key, obj in [
+            ("supplier", supplier),
+            ("customer", customer),
+            ("other_customer", other_customer),
+            ("bolt", bolt),
+        ]:
+            assert obj.id is not None
+            ids[key] = obj.id
+
+    await create_purchase(
+        PurchaseCreate(
+            invoice_number="PO-001",
+            supplier_id=ids["supplier"],
+            transaction_date=datetime(2024, 3, 1, 9, 0),
+            items=[PurchaseItemCreate(product_id=ids["bolt"], quantity=Decimal("10"), unit_price=Decimal("1.00"))],
+        )
+    )
+    for number, customer_key, day, quantity in [("INV-001", "customer", 2, "4"), ("INV-002", "other_customer", 3, "1")]:
+        await create_sale(
+            SaleCreate(
+                invoice_number=number,
+                customer_id=ids[customer_key],
+                transaction_date=datetime(2024, 3, day, 9, 0),
+                items=[SaleItemCreate(product_id=ids["bolt"], quantity=Decimal(quantity), unit_price=Decimal("2.00"))],
+            )
+        )
+    return ids
+
+
+async def test_stock_report_ledger(trading_data):
+    report = get_stock_report(product_id=trading_data["bolt"])
+
+    assert [line.reference_number for line in report] == ["PO-001", "INV-001", "INV-002"]
+    assert [line.transaction_type for line in report] == ["purchase", "sale", "sale"]
+    assert [line.balance_after for line in report] == [Decimal("10"), Decimal("6"), Decimal("5")]
+    assert all(line.product_code == "BOLT" for line in report)
+
+
+async def test_stock_report_date_range(trading_data):
+    report = get_stock_report(start_date=datetime(2024, 3, 2), end_date=datetime(2024, 3, 2, 23, 59))
+
+    assert [line.reference_number for line in report] == ["INV-001"]
+    assert [line.balance_after for line in report] == [Decimal("6")]
+
+
+async def test_stock_report_open_ended_range_starts_from_opening_balance(trading_data):
+    report = get_stock_report(product_id=trading_data["bolt"], start_date=datetime(2024, 3, 3))
+
+    assert [(line.reference_number, line.balance_after) for line in report] == [("INV-002", Decimal("5"))]
+
+
+async def test_payable_report(trading_data):
+    report = get_payable_report()
+
+    assert len(report) == 1
+    assert report[0]["supplier_code"] == "S-001"
+    assert report[0]["outstanding_amount"] == Decimal("10.00")
+    assert report[0]["payment_status"] == PaymentStatus.PENDING.value
+    assert report[0]["due_date"] is None
+
+
+async def test_receivable_report_newest_first_and_skips_paid(trading_data):
+    assert [line["invoice_number"] for line in get_receivable_report()] == ["INV-002", "INV-001"]
+
+    with get_session() as session:
+        sale = session.exec(select(Sale).where(Sale.invoice_number == "INV-002")).one()
+        sale.paid_amount = sale.total_amount
+        sale.payment_status = PaymentStatus.PAID
+        session.commit()
+
+    report = get_receivable_report()
+    assert [line["invoice_number"] for line in report] == ["INV-001"]
+    assert report[0]["customer_name"] == "Jane Doe"
+    assert report[0]["outstanding_amount"] == Decimal("8.00")
+
+
+async def test_receivable_report_for_customer(trading_data):
+    report = get_receivable_report(customer_id=trading_data["other_customer"])
+
+    assert [line["invoice_number"] for line in report] == ["INV-002"]
+
+
+def test_reports_empty(clean_db):
+    assert get_stock_report() == []
+    assert get_payable_report() == []
+    assert get_receivable_report() == []
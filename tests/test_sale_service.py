@@ -0,0 +1,237 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlmodel import col, select, text, update
+
+from app.database import get_session, query_with_loaders
+from app.inventory_service import get_stock
+from app.models import (
+    Customer,
+    PaymentStatus,
+    Product,
+    Sale,
+    SaleCreate,
+    SaleItemCreate,
+    StockMovement,
+    TransactionType,
+)
+from app.report_service import get_stock_report
+from app.sale_service import create_sale, get_sale
+
+
+@pytest.fixture()
+def catalog(clean_db):
+    with get_session() as session:
+        customer = Customer(code="C-001", name="Jane Doe")
+        bolt = Product(
+            code="BOLT",
+            name="Bolt",
+            unit="pcs",
+            purchase_price=Decimal("1.00"),
+            selling_price=Decimal("2.00"),
+            stock_quantity=Decimal("10"),
+        )
+        session.add_all([customer, bolt])
+        session.commit()
+        session.refresh(customer)
+        session.refresh(bolt)
+        return {"customer": customer, "bolt": bolt}
+
+
+@pytest.fixture()
+def new_york_clock(monkeypatch):
+    """Run the test with a process timezone west of the UTC database server."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _sale_data(catalog, *quantities: str) -> SaleCreate:
+    return SaleCreate(
+        invoice_number="INV-001",
+        customer_id=catalog["customer"].id,
+        transaction_date=datetime(2024, 3, 2, 9, 30),
+        tax_amount=Decimal("0.80"),
+        items=[
+            SaleItemCreate(product_id=catalog["bolt"].id, quantity=Decimal(quantity), unit_price=Decimal("2.00"))
+            for quantity in quantities
+        ],
+    )
+
+
+async def test_create_sale_removes_stock_and_adds_receivable(catalog):
+    sale = await create_sale(_sale_data(catalog, "4"))
+
+    assert sale.subtotal == Decimal("8.00")
+    assert sale.total_amount == Decimal("8.80")
+    assert sale.paid_amount == Decimal("0")
+    assert sale.outstanding_amount == Decimal("8.80")
+    assert sale.payment_status == PaymentStatus.PENDING
+    assert len(sale.sale_items) == 1
+
+    with get_session() as session:
+        bolt = session.get(Product, catalog["bolt"].id)
+        customer = session.get(Customer, catalog["customer"].id)
+        movement = session.exec(select(StockMovement).where(StockMovement.reference_id == sale.id)).one()
+
+        assert bolt is not None and bolt.stock_quantity == Decimal("6")
+        assert customer is not None and customer.current_balance == Decimal("8.80")
+        assert movement.transaction_type == TransactionType.SALE
+        assert movement.quantity_out == Decimal("4")
+        assert movement.unit_cost == Decimal("1.00")
+
+
+async def test_create_sale_repeated_product_lines_track_running_balance(catalog):
+    await create_sale(_sale_data(catalog, "3", "5"))
+
+    report = get_stock_report(product_id=catalog["bolt"].id)
+    assert [line.balance_after for line in report] == [Decimal("7"), Decimal("2")]
+
+
+async def test_create_sale_rounds_lines_before_summing(catalog):
+    data = _sale_data(catalog)
+    data.tax_amount = Decimal("0")
+    data.items = [
+        SaleItemCreate(product_id=catalog["bolt"].id, quantity=Decimal("1.50"), unit_price=Decimal("0.33"))
+        for _ in range(2)
+    ]
+
+    sale = await create_sale(data)
+
+    assert [item.total_amount for item in sale.sale_items] == [Decimal("0.50"), Decimal("0.50")]
+    assert sale.subtotal == sale.total_amount == Decimal("1.00")
+    with get_session() as session:
+        customer = session.get(Customer, catalog["customer"].id)
+        assert customer is not None and customer.current_balance == Decimal("1.00")
+
+
+async def test_concurrent_sales_for_one_customer_keep_both_receivables(catalog):
+    first, second = _sale_data(catalog, "1"), _sale_data(catalog, "2")
+    second.invoice_number = "INV-002"
+
+    await asyncio.gather(create_sale(first), create_sale(second))
+
+    with get_session() as session:
+        customer = session.get(Customer, catalog["customer"].id)
+        assert customer is not None and customer.current_balance == Decimal("7.60")
+
+
+async def test_create_sale_refreshes_cached_stock(catalog):
+    bolt_id = catalog["bolt"].id
+    assert get_stock([bolt_id]) == {bolt_id: Decimal("10")}
+
+    await create_sale(_sale_data(catalog, "4"))
+
+    assert get_stock([bolt_id]) == {bolt_id: Decimal("6")}
+
+
+async def test_create_sale_insufficient_stock_rolls_back(catalog):
+    with pytest.raises(ValueError, match="Insufficient stock for product BOLT"):
+        await create_sale(_sale_data(catalog, "6", "6"))
+
+    with get_session() as session:
+        bolt = session.get(Product, catalog["bolt"].id)
+        assert bolt is not None and bolt.stock_quantity == Decimal("10")
+        assert session.exec(select(Sale)).all() == []
+
+
+def test_sale_schema_rejects_unknown_fields():
+    with pytest.raises(ValidationError, match="price"):
+        SaleItemCreate.model_validate({"product_id": 1, "quantity": "1", "unit_price": "2.00", "price": "2.00"})
+
+
+async def test_create_sale_unknown_customer(catalog):
+    data = _sale_data(catalog, "1")
+    data.customer_id = 9999
+
+    with pytest.raises(ValueError, match="Customer 9999 not found"):
+        await create_sale(data)
+
+
+async def test_get_sale_loads_customer_and_items(catalog):
+    created = await create_sale(_sale_data(catalog, "4"))
+
+    assert created.id is not None
+    sale = get_sale(created.id)
+
+    assert sale is not None
+    assert sale.customer.code == catalog["customer"].code
+    assert {item.product.code for item in sale.sale_items} == {
+        p.code for p in [catalog[k] for k in catalog if k != "customer"]
+    }
+
+
+def test_get_sale_missing(clean_db):
+    assert get_sale(9999) is None
+
+
+async def test_query_with_loaders_raises_on_unloaded_relationship(catalog):
+    created = await create_sale(_sale_data(catalog, "1"))
+
+    with get_session() as session:
+        sale = session.exec(query_with_loaders(Sale).where(Sale.id == created.id)).one()
+        with pytest.raises(InvalidRequestError, match="not available"):
+            _ = sale.sale_items
+
+
+async def test_invoice_number_unique_per_year(catalog):
+    await create_sale(_sale_data(catalog, "1"))
+
+    with pytest.raises(IntegrityError):
+        await create_sale(_sale_data(catalog, "1"))
+
+    next_year = _sale_data(catalog, "1")
+    next_year.transaction_date = datetime(2025, 1, 5, 9, 0)
+    assert (await create_sale(next_year)).id is not None
+
+
+async def test_money_is_stored_as_integer_cents(catalog):
+    sale = await create_sale(_sale_data(catalog, "4"))
+
+    with get_session() as session:
+        raw = session.exec(
+            text("SELECT total_amount, outstanding_amount FROM sales WHERE id = :id").bindparams(id=sale.id)  # type: ignore[call-overload]
+        ).one()
+
+    assert tuple(raw) == (880, 880)
+
+
+async def test_money_arithmetic_scales_only_amounts(catalog):
+    sale = await create_sale(_sale_data(catalog, "4"))
+
+    with get_session() as session:
+        session.execute(
+            update(Product)
+            .where(col(Product.id) == catalog["bolt"].id)
+            .values(selling_price=col(Product.selling_price) * Decimal("1.10"))
+        )
+        session.execute(update(Sale).where(col(Sale.id) == sale.id).values(paid_amount=col(Sale.total_amount) / 2))
+        session.commit()
+
+        product = session.get(Product, catalog["bolt"].id)
+        stored = session.get(Sale, sale.id)
+        assert product is not None and stored is not None
+        assert product.selling_price == Decimal("2.20")
+        assert (stored.paid_amount, stored.outstanding_amount) == (Decimal("4.40"), Decimal("4.40"))
+
+
+async def test_naive_dates_are_utc_whatever_the_process_timezone(catalog, new_york_clock):
+    new_years_eve = _sale_data(catalog, "1")
+    new_years_eve.transaction_date = datetime(2024, 12, 31, 22, 0)
+    sale = await create_sale(new_years_eve)
+
+    assert sale.transaction_date == datetime(2024, 12, 31, 22, 0, tzinfo=timezone.utc)
+    report = get_stock_report(start_date=datetime(2024, 12, 31, 21, 0), end_date=datetime(2024, 12, 31, 23, 0))
+    assert [line.reference_number for line in report] == ["INV-001"]
+
+    # The invoice belongs to 2024, so its number is free again on New Year's Day
+    new_years_day = _sale_data(catalog, "1")
+    new_years_day.transaction_date = datetime(2025, 1, 1, 9, 0)
+    assert (await create_sale(new_years_day)).id is not None